@@ -1,15 +1,15 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-import coloredlogs
 import verboselogs
-import crcmod
+try:
+    import crcmod
+except ImportError:
+    crcmod = None
+import json
+import os
 import struct
-import typing as tp
-from abc import ABC, abstractmethod
 import yaml
-from bitstring import Bits, BitArray
-import struct
-import binascii
+import logging
 # -----------------------------------------------------------------------------
 # COPYRIGHT
 # -----------------------------------------------------------------------------
@@ -23,9 +23,104 @@ __version__ = "1.0"
 # LOGGER
 # -----------------------------------------------------------------------------
 
-verboselogs.install()
 logger = verboselogs.VerboseLogger(__name__)
-coloredlogs.install(level="verbose", logger=logger)
+
+# Cached so hot paths skip the logging call machinery entirely when the
+# debug level is filtered out.
+_DEBUG = logger.isEnabledFor(logging.DEBUG)
+
+_LOGGING_CONFIGURED = False
+
+
+def _configure_logging() -> None:
+    """Install the colored log handlers.
+
+    Deferred out of import time so programs embedding this module do not pay
+    for handler and ANSI setup unless they actually run it as a script.
+    """
+    global _LOGGING_CONFIGURED, _DEBUG
+    if _LOGGING_CONFIGURED:
+        return
+    import coloredlogs
+    verboselogs.install()
+    coloredlogs.install(level="verbose", logger=logger)
+    _LOGGING_CONFIGURED = True
+    _DEBUG = logger.isEnabledFor(logging.DEBUG)
+
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _load_yaml_cached(yaml_file: str) -> dict:
+    """Load a YAML file, reusing a JSON sidecar cache when it is up to date.
+
+    JSON deserialization of the already-parsed data is an order of magnitude
+    faster than re-parsing the YAML, so the cache shrinks startup time for
+    every run after the first. Cache misses or unwritable locations fall back
+    to a plain YAML parse.
+    """
+    cache_file = yaml_file + ".cache.json"
+    try:
+        if os.path.getmtime(cache_file) >= os.path.getmtime(yaml_file):
+            with open(cache_file, 'r') as cache:
+                return json.load(cache)
+    except (OSError, ValueError):
+        pass
+
+    with open(yaml_file, 'r') as file:
+        try:
+            data = yaml.load(file, Loader=_YAML_LOADER)
+        except yaml.YAMLError:
+            if _YAML_LOADER is yaml.SafeLoader:
+                raise
+            # libyaml is stricter than the pure-Python parser (e.g. empty
+            # values in flow mappings); retry with SafeLoader before failing.
+            file.seek(0)
+            data = yaml.load(file, Loader=yaml.SafeLoader)
+    try:
+        tmp_file = cache_file + ".tmp"
+        with open(tmp_file, 'w') as cache:
+            json.dump(data, cache)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError):
+        pass
+    return data
+
+
+def _crc16_8005_build_table() -> list:
+    table = []
+    for index in range(256):
+        crc = index << 8
+        for _ in range(8):
+            if crc & 0x8000:
+                crc = ((crc << 1) ^ 0x8005) & 0xFFFF
+            else:
+                crc = (crc << 1) & 0xFFFF
+        table.append(crc)
+    return table
+
+
+# The protocol feeds data bits into the CRC LSB-first, so each byte is
+# bit-reversed before indexing the MSB-first table.
+_CRC16_TABLE = _crc16_8005_build_table()
+_BIT_REVERSE = [int('{:08b}'.format(index)[::-1], 2) for index in range(256)]
+
+# crcmod's C extension computes the fully reflected CRC-16/ARC; the protocol
+# reflects the input but not the output, so the 16-bit result is bit-reversed
+# to match the table loop. Falls back to the table when crcmod is absent.
+_CRC16_ARC = crcmod.mkCrcFun(0x18005, initCrc=0, rev=True, xorOut=0x0000) if crcmod else None
+
+
+def _crc16_8005(data: bytes) -> int:
+    """CRC-16 over data with polynomial 0x8005, reflected input, straight output."""
+    if _CRC16_ARC is not None:
+        arc = _CRC16_ARC(data)
+        return (_BIT_REVERSE[arc & 0xFF] << 8) | _BIT_REVERSE[arc >> 8]
+    crc_register = 0
+    for byte in data:
+        crc_register = ((crc_register << 8)
+                        ^ _CRC16_TABLE[((crc_register >> 8) ^ _BIT_REVERSE[byte]) & 0xFF]) & 0xFFFF
+    return crc_register
 
 
 # -----------------------------------------------------------------------------
@@ -35,36 +130,62 @@ coloredlogs.install(level="verbose", logger=logger)
 class CommandLoader:
     def __init__(self, yaml_file: str) -> None:
         logger.debug("Initializing CommandLoader with YAML file: %s", yaml_file)
-        with open(yaml_file, 'r') as file:
-            self.data = yaml.safe_load(file)
+        self.yaml_file = yaml_file
+        self.data = _load_yaml_cached(yaml_file)
+        self._cmds = self.data['COMMAND_FIELDS']
+        self._proto = self.data.get('PROTOCOL_FIELDS')
         logger.debug("Loaded %d fieldgroups from YAML file", len(self.data))
 
+    def load_command(self, name: str) -> dict:
+        """Parse only the named command from the YAML file.
+
+        Walks the composed node graph and constructs Python objects solely
+        for the requested COMMAND_FIELDS entry, so the cost of building
+        dicts for every other command is skipped. Useful for tools that
+        need a single command without paying for a full load.
+        """
+        for loader_cls in (_YAML_LOADER, yaml.SafeLoader):
+            with open(self.yaml_file, 'r') as file:
+                loader = loader_cls(file)
+                try:
+                    try:
+                        node = loader.get_single_node()
+                    except yaml.YAMLError:
+                        if loader_cls is yaml.SafeLoader:
+                            raise
+                        continue
+                    for key_node, value_node in node.value:
+                        if key_node.value != 'COMMAND_FIELDS':
+                            continue
+                        for cmd_node, fields_node in value_node.value:
+                            if cmd_node.value == name:
+                                return loader.construct_object(fields_node, deep=True)
+                    logger.error("Command not found.")
+                    return None
+                finally:
+                    loader.dispose()
+
     def get_commands(self) -> list:
-        logger.debug("Searching for available commands...")
-        results = list(self.data['COMMAND_FIELDS'].keys())
-        logger.debug("%s commands found...", len(results))
+        results = list(self._cmds)
+        if _DEBUG:
+            logger.debug("%s commands found...", len(results))
         return results
 
     def get_command_dict(self, name) -> dict:
-        logger.debug("Searching command dict for "+name)
-        if name in self.get_commands():
-            logger.debug("Command dict found!")
-            return self.data['COMMAND_FIELDS'][name]
+        if _DEBUG:
+            logger.debug("Searching command dict for %s", name)
+        result = self._cmds.get(name)
+        if result is not None:
+            return result
         logger.error("Command not found.")
 
     def get_protocol_dict(self) -> dict:
-        logger.debug("Searching for additional fields...")
-        results = self.data['PROTOCOL_FIELDS']
-        if results:
-            logger.debug("Additional fields found!")
-            return results
+        if self._proto:
+            return self._proto
 
     def get_request_dict(self, name) -> dict:
-        logger.debug("Searching request dict for "+name)
         result = self.get_command_dict(name)
-        result = result['REQUEST']
-        logger.debug("Found request fields!")
-        return result
+        return result['REQUEST']
 
     def get_response_dict(self, name):
         logger.debug("Searching response dict for "+name)
@@ -72,16 +193,21 @@ class CommandLoader:
 
     def load(self, yaml_file: str) -> None:
         logger.debug("Reinitializing CommandLoader with YAML file: %s", yaml_file)
-        with open(yaml_file, 'r') as file:
-            self.data = yaml.safe_load(file)
+        self.yaml_file = yaml_file
+        self.data = _load_yaml_cached(yaml_file)
+        self._cmds = self.data['COMMAND_FIELDS']
+        self._proto = self.data.get('PROTOCOL_FIELDS')
         logger.debug("Loaded %d fieldgroups from YAML file", len(self.data))
 
 class Field:
     def __init__(self, name, load=None, min=None, max=None, size=8, help_str=None, value=0, **kwargs) -> None:
-        logger.debug("Initializing field %s ...", name)
+        if _DEBUG:
+            logger.debug("Initializing field %s ...", name)
         self.name = name
         self.value = value
         self.load = load
+        # frozenset gives O(1) membership checks on the bulk-set hot path.
+        self._load_set = frozenset(load) if load else None
         self.min = min
         self.max = max
         self.size = size
@@ -89,68 +215,54 @@ class Field:
         if load:
             self.set_val(load[0])
 
-        logger.debug("Initialized Field %s", self.name)
-        logger.spam("Set field load to %s", self.load)
-        logger.spam("Set field min to %s", self.min)
-        logger.spam("Set field max to %s", self.max)
-        logger.spam("Set field size to %s", self.size)
-        logger.spam("Set field help_str to %s", self.help_str)
-        logger.spam("Set field value to %s", self.value)
+        if _DEBUG:
+            logger.debug("Initialized Field %s", self.name)
+            logger.spam("Set field load to %s", self.load)
+            logger.spam("Set field min to %s", self.min)
+            logger.spam("Set field max to %s", self.max)
+            logger.spam("Set field size to %s", self.size)
+            logger.spam("Set field help_str to %s", self.help_str)
+            logger.spam("Set field value to %s", self.value)
 
     def get_name(self) -> str:
-        logger.debug("Fetching name...")
-        result = self.name
-        logger.debug("name found! %s", result)
-        return result
+        return self.name
 
     def get_load(self) -> list:
-        logger.debug("Fetching load (defaults)...")
-        result = self.load
-        logger.debug("load (defaults) found! %s", result)
-        return result
+        return self.load
 
     def get_min(self) -> int:
-        logger.debug("Fetching min...")
-        result = self.min
-        logger.debug("min found! %s", result)
-        return result
+        return self.min
 
     def get_max(self) -> int:
-        logger.debug("Fetching max...")
-        result = self.max
-        logger.debug("max found! %s", result)
-        return result
+        return self.max
 
     def set_val(self, value: int) -> None:
-        if self.min:
-            assert value >= self.min, "Error while trying to set value. Did you check min?"
-
-        if self.max:
-            assert value <= self.max, "Error while trying to set value. Did you check max?"
-
-        if self.load:
-            try:
-                assert value in self.load, "Error while trying to set value. Did you check load?"
-            except:
-                logger.error("Error while trying to set parameter %s", self.name)
-                logger.error("Select one of the following values: %s", self.load)
-
-        if isinstance(value,int):
-            self.value = value
-            logger.debug("Setting value to %s of field "+self.name, value)
+        if not isinstance(value, int):
+            logger.error("Unknown error while trying to set value")
             return
 
-        logger.error("Unknown error while trying to set value")
+        if self.min is not None and value < self.min:
+            raise ValueError("Error while trying to set value. Did you check min?")
+
+        if self.max is not None and value > self.max:
+            raise ValueError("Error while trying to set value. Did you check max?")
+
+        if self._load_set is not None and value not in self._load_set:
+            logger.error("Error while trying to set parameter %s", self.name)
+            logger.error("Select one of the following values: %s", self.load)
+            raise ValueError("Error while trying to set value. Did you check load?")
+
+        self.value = value
+        if _DEBUG:
+            logger.debug("Setting value to %s of field %s", value, self.name)
 
     def get_val(self) -> int:
-        logger.debug("Fetching value...")
-        result = self.value
-        logger.debug("Value found! %s", result)
-        return result
+        return self.value
 
-    def get_raw(self) -> Bits:
-        bits = Bits(uint=self.value, length=self.size)
-        return bits
+    def get_raw(self) -> bytes:
+        # Big-endian, padded with zero bits on the right like Bits.tobytes().
+        pad = -self.size % 8
+        return (self.value << pad).to_bytes((self.size + pad) // 8, 'big')
 
     def help(self) -> None:
         logger.info(self.help_str)
@@ -162,52 +274,45 @@ class Field:
 
 class Command:
     def __init__(self, name, help_str):
-        logger.debug("Initializing command %s ...", name)
+        if _DEBUG:
+            logger.debug("Initializing command %s ...", name)
         self.name = name
-        self.fields = {}
+        self.fields = []
         self.help_str = help_str
-        self.next_index = 0
-        logger.debug("Initialized command %s", name)
+        self._name_index = {}
 
     def get_parameters(self) -> list:
-        logger.debug("Searching available parameters...")
         results = []
         for field in self:
             results.append(field.get_name())
         if results:
-            logger.debug("Parameters found! %s", results)
             return results
 
     def add_field(self, field: Field) -> None:
-        logger.debug("Adding field at index %s", self.next_index)
-
-        self.fields[self.next_index] = field
-        self.next_index += 1
-        logger.debug("Added field.")
+        if _DEBUG:
+            logger.debug("Adding field at index %s", len(self.fields))
+        self._name_index[field.name] = len(self.fields)
+        self.fields.append(field)
 
     def get_field(self, name=None, index=None) -> Field:
-        if index:
+        if index is not None:
             return self.fields[index]
-        if name:
-            for field in self:
-                if field.get_name() == name:
-                    return field
+        if name is not None:
+            index = self._name_index.get(name)
+            if index is not None:
+                return self.fields[index]
         logger.error("Neither name nor index given. Please set either.")
 
     def set_field(self, name, value) -> None:
-        logger.debug("")
         self.get_field(name=name).set_val(value)
-        logger.debug("")
 
     def get_size(self) -> int:
-        logger.debug("")
         size = 0
         for field in self:
             size+=field.size
         return size
 
     def get_name(self) -> str:
-        logger.debug("")
         return self.name
 
     def get_raw(self, start_index = 0, end_index=None) -> bytes:
@@ -216,27 +321,28 @@ class Command:
         if not end_index:
             end_index = len(self)
 
-        fields = [field for field in self]
-        fields = fields[start_index:end_index+1]
-        result = b''
+        return self._serialize_range(start_index, end_index)
 
-        for field in fields:
-            result += field.get_raw()
+    def _serialize_range(self, start_index: int, stop_index: int) -> bytes:
+        acc = 0
+        nbits = 0
+        for field in self.fields[start_index:stop_index + 1]:
+            acc = (acc << field.size) | (field.value & ((1 << field.size) - 1))
+            nbits += field.size
 
-        if isinstance(result, Bits):
-            result = result.tobytes()
-            return result
+        if not nbits:
+            raise ValueError
 
-        raise ValueError
+        # Pad with zero bits on the right to the next byte boundary, matching
+        # the bit-concatenation semantics of the old bitstring implementation.
+        pad = -nbits % 8
+        return (acc << pad).to_bytes((nbits + pad) // 8, 'big')
 
     def __iter__(self) -> Command:
-        logger.spam("Initialized iteration.")
         self._iter_index = 0
-        logger.spam("Iteration initialized.")
         return self
 
     def __next__(self):
-        logger.spam("Current index in iteration: %s", self._iter_index)
         if self._iter_index < len(self.fields):
             result = self.fields[self._iter_index]
             self._iter_index += 1
@@ -245,7 +351,7 @@ class Command:
             raise StopIteration
 
     def __len__(self):
-        return self.next_index
+        return len(self.fields)
 
     def __getitem__(self, item):
         return self.get_field(item)
@@ -257,34 +363,18 @@ class Command:
     # def crc16_calculate(length, data: bytes) -> bytes:
 
     def crc16_calculate(self, start_index, stop_index, target_index) -> bytes:
-        # NO FUCKING CLUE HOW I GOT THAT WORKING
-        fields_total = [field for field in self]
-        fields = fields_total[start_index:stop_index + 1]
         size = 0
-        for field in fields:
+        for field in self.fields[start_index:stop_index + 1]:
             size += field.size
 
         assert size % 8 == 0, "CRC only works for full bytes here."
-        length = size // 8
-        data = self.get_raw(start_index=start_index, end_index=stop_index)
+        data = self._serialize_range(start_index, stop_index)
 
         crc = [0, 0]
-        polynom = 0x8005
-        crc_register = (crc[0] & 0xFF) | ((crc[1] & 0xFF) << 8)
-
-        for counter in range(length):
-            for shift_register in range(8):
-                data_bit = (data[counter] >> shift_register) & 0x01
-                crc_bit = (crc_register >> 15) & 0x01
-                crc_register <<= 1
-                crc_register &= 0xFFFF  # Ensure CRC register remains 16-bit
-                if data_bit != crc_bit:
-                    crc_register ^= polynom
-                crc_register &= 0xFFFF  # Ensure CRC register remains 16-bit
-
+        crc_register = _crc16_8005(data)
         crc[0] = crc_register & 0xFF
         crc[1] = (crc_register >> 8) & 0xFF
-        target_field: Field = fields_total[target_index]
+        target_field: Field = self.fields[target_index]
         self.set_field(target_field.name, int.from_bytes(bytes(crc), "big"))
         return bytes(True)
 
@@ -505,4 +595,5 @@ def main():
     com_if.close()
 
 if __name__ == "__main__":
+    _configure_logging()
     main()
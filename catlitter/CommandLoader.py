@@ -1,12 +1,14 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 import typing as tp
-import coloredlogs
+from dataclasses import dataclass, field
 import verboselogs
 import yaml
+import hashlib
+import json
+import os
+import pickle
 import struct
-import binascii
-from catlitter.VirtualRegister import VirtualRegister
 
 # -----------------------------------------------------------------------------
 # COPYRIGHT
@@ -21,22 +23,176 @@ __version__ = "1.0"
 # LOGGER
 # -----------------------------------------------------------------------------
 
-verboselogs.install()
 logger = verboselogs.VerboseLogger("module_logger")
-coloredlogs.install(level="debug", logger=logger)
+
+_LOGGING_CONFIGURED = False
+
+
+def _configure_logging() -> None:
+    """Install the colored log handlers.
+
+    Deferred out of import time so programs embedding this module do not pay
+    for handler and ANSI setup unless they actually run it as a script.
+    """
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+    import coloredlogs
+    verboselogs.install()
+    coloredlogs.install(level="debug", logger=logger)
+    _LOGGING_CONFIGURED = True
+
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _crc16_ccitt_build_table() -> list:
+    table = []
+    for index in range(256):
+        crc = index << 8
+        for _ in range(8):
+            if crc & 0x8000:
+                crc = ((crc << 1) ^ 0x1021) & 0xFFFF
+            else:
+                crc = (crc << 1) & 0xFFFF
+        table.append(crc)
+    return table
+
+
+_CRC16_CCITT_TABLE = _crc16_ccitt_build_table()
+
+# Prebound packers for the common byte-aligned field widths; struct.Struct
+# skips the per-call format-string parsing of int.to_bytes dispatch.
+_PACK_U8 = struct.Struct('>B').pack
+_PACK_U16 = struct.Struct('>H').pack
+_PACK_U32 = struct.Struct('>I').pack
+_PACKERS = {1: _PACK_U8, 2: _PACK_U16, 4: _PACK_U32}
+
+
+def _crc16_ccitt(data: bytes) -> int:
+    """CRC-16/CCITT-FALSE over data (polynomial 0x1021, init 0xFFFF)."""
+    crc = 0xFFFF
+    for byte in data:
+        crc = ((crc << 8) ^ _CRC16_CCITT_TABLE[((crc >> 8) ^ byte) & 0xFF]) & 0xFFFF
+    return crc
+
+
+def _load_yaml_cached(yaml_file: str) -> dict:
+    """Load a YAML file, reusing a JSON sidecar cache when it is up to date.
+
+    JSON deserialization of the already-parsed data is an order of magnitude
+    faster than re-parsing the YAML, so the cache shrinks startup time for
+    every run after the first. Cache misses or unwritable locations fall back
+    to a plain YAML parse.
+    """
+    cache_file = yaml_file + ".cache.json"
+    try:
+        if os.path.getmtime(cache_file) >= os.path.getmtime(yaml_file):
+            with open(cache_file, 'r') as cache:
+                return json.load(cache)
+    except (OSError, ValueError):
+        pass
+
+    with open(yaml_file, 'r') as file:
+        try:
+            data = yaml.load(file, Loader=_YAML_LOADER)
+        except yaml.YAMLError:
+            if _YAML_LOADER is yaml.SafeLoader:
+                raise
+            # libyaml is stricter than the pure-Python parser (e.g. empty
+            # values in flow mappings); retry with SafeLoader before failing.
+            file.seek(0)
+            data = yaml.load(file, Loader=yaml.SafeLoader)
+    try:
+        tmp_file = cache_file + ".tmp"
+        with open(tmp_file, 'w') as cache:
+            json.dump(data, cache)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError):
+        pass
+    return data
+
+
+def _descriptor_cache_path(abspath: str) -> str:
+    """Return the pickle-cache location for a given config file.
+
+    Lives under $XDG_CACHE_HOME/visca (defaulting to ~/.cache/visca), one
+    file per config path so different configs do not evict each other.
+    """
+    cache_root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    digest = hashlib.md5(abspath.encode()).hexdigest()[:12]
+    return os.path.join(cache_root, 'visca', f'commands-{digest}.pkl')
+
+
+def _load_descriptor_cache(cache_path: str, key: tuple):
+    """Load the pickled parse product if its key still matches, else None."""
+    try:
+        with open(cache_path, 'rb') as cache:
+            cached_key, payload = pickle.load(cache)
+        if cached_key == key:
+            return payload
+    except (OSError, pickle.PickleError, EOFError, ValueError, AttributeError, ImportError):
+        pass
+    return None
+
+
+def _store_descriptor_cache(cache_path: str, key: tuple, payload: tuple) -> None:
+    """Atomically write the pickled parse product; failures are ignored."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_file = cache_path + ".tmp"
+        with open(tmp_file, 'wb') as cache:
+            pickle.dump((key, payload), cache, protocol=5)
+        os.replace(tmp_file, cache_path)
+    except (OSError, pickle.PickleError):
+        pass
 
 
 # -----------------------------------------------------------------------------
 # CLASSES
 # -----------------------------------------------------------------------------
 
+@dataclass(slots=True, frozen=True)
+class CommandDescriptor:
+    """
+    Immutable compiled form of a byte-template command.
+
+    Separates parsing from execution: the YAML entry is walked exactly once
+    at load time, and every VirtualRegister built from the descriptor just
+    copies the template instead of re-extracting parameters.
+    """
+    name: str
+    template_bytes: bytes
+    param_index: dict
+    param_sets: dict
+    raw: dict = field(repr=False)
+
+
+def _compile_descriptor(command: dict) -> CommandDescriptor:
+    param_index = {}
+    param_sets = {}
+    for i, byte in enumerate(command['bytes']):
+        if isinstance(byte, dict):
+            param_index[byte['param_name']] = i
+            param_sets[byte['param_name']] = frozenset(byte['values'])
+    template = bytes(b if isinstance(b, int) else 0x00 for b in command['bytes'])
+    return CommandDescriptor(name=command['name'], template_bytes=template,
+                             param_index=param_index, param_sets=param_sets,
+                             raw=command)
+
+
 class CommandLoader:
     """
     Class to load and manage commands from a YAML file.
 
+    Handles both config schemas in use: the field-level gimbal schema
+    (COMMAND_FIELDS/PROTOCOL_FIELDS) and the flat byte-template schema
+    (a top-level 'commands' list) consumed by the device handlers.
+
     Attributes:
-        commands (dict): Commands loaded from the YAML file.
-        protocol (dict): Protocol configuration loaded from the YAML file.
+        commands (list): Byte-template commands loaded from the YAML file.
+        command_fields (dict): Field-level commands loaded from the YAML file.
+        protocol_fields (dict): Protocol configuration loaded from the YAML file.
     """
 
     def __init__(self, yaml_file: str):
@@ -47,11 +203,59 @@ class CommandLoader:
             yaml_file (str): Path to the YAML file containing commands.
         """
         logger.debug("Initializing CommandLoader with YAML file: %s", yaml_file)
-        with open(yaml_file, 'r') as file:
-            data = yaml.safe_load(file)
-            self.command_fields = data['COMMAND_FIELDS']
-            self.protocol_fields = data['PROTOCOL_FIELDS']
-        logger.debug("Loaded %d commands from YAML file", len(self.command_fields))
+        # Across process launches the whole parse product is pickle-cached,
+        # keyed on the config's absolute path and mtime: a repeat start-up is
+        # one stat plus a small pickle load, no YAML parse, no recompile.
+        abspath = os.path.abspath(yaml_file)
+        try:
+            key = (abspath, os.stat(abspath).st_mtime_ns)
+        except OSError:
+            key = None
+        cache_path = _descriptor_cache_path(abspath)
+        payload = _load_descriptor_cache(cache_path, key) if key is not None else None
+        if payload is not None:
+            (self.command_fields, self.protocol_fields,
+             self.commands, self._descriptors) = payload
+        else:
+            data = _load_yaml_cached(yaml_file)
+            self.command_fields = data.get('COMMAND_FIELDS', {})
+            self.protocol_fields = data.get('PROTOCOL_FIELDS', {})
+            self.commands = data.get('commands', [])
+            # Compiled descriptors: one schema walk per command, at load time.
+            self._descriptors = {command['name']: _compile_descriptor(command)
+                                 for command in self.commands}
+            if key is not None:
+                _store_descriptor_cache(cache_path, key,
+                                        (self.command_fields, self.protocol_fields,
+                                         self.commands, self._descriptors))
+        # Name index so get_command is a hash probe instead of a list scan.
+        self._by_name = {command['name']: command for command in self.commands}
+        logger.debug("Loaded %d commands from YAML file",
+                     len(self.command_fields) or len(self.commands))
+
+    def get_command(self, name: str) -> tp.Optional[dict]:
+        """
+        Retrieve a byte-template command by name.
+
+        Args:
+            name (str): The name of the command to retrieve.
+
+        Returns:
+            dict: The command dictionary if found, otherwise None.
+        """
+        return self._by_name.get(name)
+
+    def get_descriptor(self, name: str) -> tp.Optional[CommandDescriptor]:
+        """
+        Retrieve the compiled descriptor for a byte-template command.
+
+        Args:
+            name (str): The name of the command to retrieve.
+
+        Returns:
+            CommandDescriptor: The compiled descriptor if found, otherwise None.
+        """
+        return self._descriptors.get(name)
 
     def get_request_fields(self, name: str) -> tp.Optional[dict]:
         """
@@ -130,6 +334,9 @@ class Field:
         self.index = field_dict.get('index')
         self.help_text = field_dict.get('help')
         self.value = 0
+        self._raw_cache = None
+        size = self.size
+        self._pack = _PACKERS.get((size + 7) // 8) if isinstance(size, int) and size > 0 else None
         if self.load:
             self.value = self.load[0]
 
@@ -146,8 +353,10 @@ class Field:
         if self.min and self.max:
             if self.min <= value <= self.max:
                 self.value = value
+                self._raw_cache = None
                 return
         self.value = value
+        self._raw_cache = None
         return
         raise ValueError(f"Value {value} out of range ({self.min}, {self.max})")
 
@@ -161,33 +370,36 @@ class Field:
 class Command:
     def __init__(self):
         self.raw = None
-        self.fields = {}
-        self.next_index = 0
+        self.fields = []
         self.help_text = None
+        self._name_index = {}
+        self._dirty = True
+        self._raw_buf = None
+        self._offsets = None
 
     def add_field(self, name, field_dict):
-        logger.debug("Adding Field: %s at index: " + str(self.next_index), name)
-        self.fields[self.next_index] = Field(name, field_dict)
-        self.next_index += 1
-        self.update()
+        logger.debug("Adding Field: %s at index: %d", name, len(self.fields))
+        self._name_index[name] = len(self.fields)
+        self.fields.append(Field(name, field_dict))
+        self._dirty = True
         # logger.debug("Added field %s successfully.", name)
 
     def set_parameter(self, name: str, value):
-        for field in self.fields.values():
-            if field.name == name:
-                field.set_load(value)
-                self.update()
-                return
-        raise ValueError(f"No field found with name {name}")
+        index = self._name_index.get(name)
+        if index is None:
+            raise ValueError(f"No field found with name {name}")
+        self.fields[index].set_load(value)
+        self._dirty = True
 
     def get_parameter(self, name):
-        for field in self.fields.values():
-            if field.name == name:
-                return field.value
-        raise ValueError(f"No field found with name {name}")
+        index = self._name_index.get(name)
+        if index is None:
+            raise ValueError(f"No field found with name {name}")
+        return self.fields[index].value
 
     def get_raw(self):
-        self.update()
+        if self._dirty:
+            self.update()
         return self.raw
 
     @staticmethod
@@ -201,16 +413,7 @@ class Command:
         Returns:
             int: The computed CRC16 checksum.
         """
-        crc = 0xFFFF
-        for byte in data:
-            crc ^= byte << 8
-            for _ in range(8):
-                if crc & 0x8000:
-                    crc = (crc << 1) ^ 0x1021
-                else:
-                    crc <<= 1
-            crc &= 0xFFFF
-        return crc
+        return _crc16_ccitt(data)
 
     def calculate_checksum(self, start_index: int, stop_index: int, target_index: int):
         """
@@ -227,27 +430,24 @@ class Command:
         if start_index < 0 or stop_index >= len(self.fields) or target_index >= len(self.fields):
             raise ValueError("Invalid indices")
 
-        raw_data = b''
-        for i in range(start_index, stop_index + 1):
-            field = self.fields[i]
-            if field.size == -1:
-                raise ValueError(f"Field {field.name} has invalid size -1")
-
-            size_in_bytes = (field.size + 7) // 8
-
-            if field.load is None:
-                field.value = 0
-
-            field_data = field.value.to_bytes(size_in_bytes, byteorder='big')
-            raw_data += field_data
-
-        checksum = self.crc16(raw_data)
-        self.fields[target_index].set_load(checksum)
-
-    def update(self):
+        checksum = self.crc16(self._serialize_range(start_index, stop_index))
+        target = self.fields[target_index]
+        target.set_load(checksum)
+        if not self._dirty and self._offsets is not None:
+            # The cached frame is current and only the target field changed:
+            # splice its re-encoded bytes in at the recorded offset instead
+            # of rebuilding the whole buffer.
+            field_data = self._encode_field(target)
+            offset = self._offsets[target_index]
+            self._raw_buf[offset:offset + len(field_data)] = field_data
+            self.raw = self._raw_buf.hex()
+        else:
+            self._dirty = True
 
-        raw_data = b''
-        for field in self.fields.values():
+    @staticmethod
+    def _encode_field(field: Field) -> bytes:
+        field_data = field._raw_cache
+        if field_data is None:
             if field.size == -1:
                 raise ValueError(f"Field {field.name} has invalid size -1")
 
@@ -257,10 +457,27 @@ class Command:
             if field.load is None:
                 field.value = 0
 
-            field_data = field.value.to_bytes(size_in_bytes, byteorder='big')
-            raw_data += field_data
+            if field._pack is not None:
+                field_data = field._pack(field.value)
+            else:
+                field_data = field.value.to_bytes(size_in_bytes, byteorder='big')
+            field._raw_cache = field_data
+        return field_data
 
-        self.raw = raw_data.hex()
+    def _serialize_range(self, start_index: int, stop_index: int) -> bytes:
+        encode = self._encode_field
+        return b''.join(encode(field) for field in self.fields[start_index:stop_index + 1])
+
+    def update(self):
+        buf = bytearray()
+        offsets = []
+        for field in self.fields:
+            offsets.append(len(buf))
+            buf.extend(self._encode_field(field))
+        self._raw_buf = buf
+        self._offsets = offsets
+        self.raw = buf.hex()
+        self._dirty = False
 
     def __iter__(self) -> Field:
         self._iter_index = 0
@@ -275,20 +492,19 @@ class Command:
             raise StopIteration
 
     def __getitem__(self, item):
-        for field in self.fields.values():
-            if field.name == item:
-                return field
-        raise ValueError(f"No field found with name {name}")
+        index = self._name_index.get(item)
+        if index is None:
+            raise ValueError(f"No field found with name {item}")
+        return self.fields[index]
 
     def help(self, name=None):
         if name:
-            for field in self.fields.values():
-                if field.name == name:
-                    print(field.help_text)
-                    return
-            raise ValueError(f"No field found with name {name}")
+            index = self._name_index.get(name)
+            if index is None:
+                raise ValueError(f"No field found with name {name}")
+            print(self.fields[index].help_text)
         else:
-            for field in self.fields.values():
+            for field in self.fields:
                 logger.debug(f"Help for Field {field.name}: {field.help_text}")
 
 
@@ -296,28 +512,40 @@ class CommandBuilder:
     def __init__(self, field_config: str):
         self.loader = CommandLoader(field_config)
         self.commands = self.loader.get_command_list()
+        # Per-command field specs and header checksum, resolved on first build.
+        self._build_cache = {}
 
     def build_command(self, cmd_name: str) -> Command:
         logger.debug("Building command %s...", cmd_name)
 
-        command_dict = self.loader.get_command_dict(cmd_name)
-        f_req_dict = command_dict['REQUEST']
-        f_pro_dict = self.loader.protocol_fields
-
+        template = self._build_cache.get(cmd_name)
+        if template is None:
+            command_dict = self.loader.get_command_dict(cmd_name)
+            f_req_dict = command_dict['REQUEST']
+            f_pro_dict = self.loader.protocol_fields
+
+            specs = [('START_CHARACTER', f_pro_dict['START_CHARACTER']),
+                     ('COMMAND_ID', command_dict['CMD_ID']),
+                     ('PAYLOAD_SIZE', f_pro_dict['PAYLOAD_SIZE']),
+                     ('HEADER_CHECKSUM', f_pro_dict['HEADER_CHECKSUM'])]
+            specs.extend(f_req_dict.items())
+            specs.append(('PAYLOAD_CHECKSUM', f_pro_dict['PAYLOAD_CHECKSUM']))
+
+            cmd = Command()
+            for field_name, field_dict in specs:
+                cmd.add_field(field_name, field_dict)
+            cmd.calculate_checksum(0, 2, 3)
+            self._build_cache[cmd_name] = (specs, cmd.fields[3].value)
+            logger.debug("...built command %s", cmd_name)
+            return cmd
+
+        # The header fields are constant per command, so later builds reuse
+        # the resolved specs and the precomputed header checksum.
+        specs, header_checksum = template
         cmd = Command()
-        cmd.add_field('START_CHARACTER', f_pro_dict['START_CHARACTER'])
-        cmd.add_field('COMMAND_ID', command_dict['COMMAND_ID'])
-        cmd.add_field('PAYLOAD_SIZE', f_pro_dict['PAYLOAD_SIZE'])
-        val = cmd['PAYLOAD_SIZE']
-        val
-        cmd.add_field('HEADER_CHECKSUM', f_pro_dict['HEADER_CHECKSUM'])
-        # cmd.
-        for key, value in f_req_dict.items():
-            cmd.add_field(key, value)
-
-        cmd.add_field('PAYLOAD_CHECKSUM', f_pro_dict['PAYLOAD_CHECKSUM'])
-        cmd.calculate_checksum(0,2,3)
-        # cmd.update()
+        for field_name, field_dict in specs:
+            cmd.add_field(field_name, field_dict)
+        cmd.fields[3].set_load(header_checksum)
         logger.debug("...built command %s", cmd_name)
         return cmd
 
@@ -329,8 +557,9 @@ class CommandBuilder:
             return None
 
         response = Command()
-        response.fields = {key: Field(name=key, field_dict=value) for key, value in response_config.items() if
-                           key != 'CMD_HELP'}
+        response.fields = [Field(name=key, field_dict=value) for key, value in response_config.items() if
+                           key != 'CMD_HELP']
+        response._name_index = {field.name: index for index, field in enumerate(response.fields)}
         logger.debug(f"Built response: {response}")
 
         return response
@@ -361,4 +590,5 @@ def main():
 
 
 if __name__ == "__main__":
+    _configure_logging()
     main()
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-import coloredlogs
-import verboselogs
 from abc import ABC, abstractmethod
+
+from catlitter._logging import get_logger
+
 # -----------------------------------------------------------------------------
 # COPYRIGHT
 # -----------------------------------------------------------------------------
@@ -16,9 +17,7 @@ __version__ = "1.0"
 # LOGGER
 # -----------------------------------------------------------------------------
 
-verboselogs.install()
-logger = verboselogs.VerboseLogger("module_logger")
-coloredlogs.install(level="debug", logger=logger)
+logger = get_logger(__name__)
 
 
 # -----------------------------------------------------------------------------
@@ -32,6 +31,9 @@ class CommunicationInterface(ABC):
     and writing to the communication interface.
     """
 
+    # Empty so slotted subclasses actually shed their per-instance __dict__.
+    __slots__ = ()
+
     @abstractmethod
     def open(self):
         """
@@ -59,6 +61,38 @@ class CommunicationInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def read_until(self, expected: bytes) -> bytes:
+        """
+        Read data from the communication interface until the expected
+        terminator sequence is found or the timeout expires.
+
+        Args:
+            expected (bytes): The terminator sequence to read up to.
+
+        Returns:
+            bytes: The data read, including the terminator if it was found.
+        """
+        pass
+
+    def read_into(self, buf: bytearray) -> int:
+        """
+        Read available data into a caller-provided buffer.
+
+        The default implementation wraps read(); interfaces with a native
+        readinto can override it to avoid the intermediate allocation.
+
+        Args:
+            buf (bytearray): The buffer to fill.
+
+        Returns:
+            int: The number of bytes read.
+        """
+        data = self.read(len(buf))
+        n = len(data)
+        buf[:n] = data
+        return n
+
     @abstractmethod
     def write(self, data: bytes):
         """
@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-import coloredlogs
-import verboselogs
 from catlitter import CommandLoader
 from catlitter import CommunicationInterface
+from catlitter.VirtualRegister import VirtualRegister
 from abc import ABC, abstractmethod
 
+from catlitter._logging import get_logger
+
 # -----------------------------------------------------------------------------
 # COPYRIGHT
 # -----------------------------------------------------------------------------
@@ -19,9 +20,7 @@ __version__ = "1.0"
 # LOGGER
 # -----------------------------------------------------------------------------
 
-verboselogs.install()
-logger = verboselogs.VerboseLogger("module_logger")
-coloredlogs.install(level="debug", logger=logger)
+logger = get_logger(__name__)
 
 
 # -----------------------------------------------------------------------------
@@ -31,7 +30,104 @@ class DeviceHandler(ABC):
     def __init__(self, command_loader: CommandLoader, communication_interface: CommunicationInterface):
         self.command_loader = command_loader
         self.communication_interface = communication_interface
+        # Bound-method aliases so each command skips the attribute lookup and
+        # bound-method construction on the interface object.
+        self._write = communication_interface.write
+        self._read_until = communication_interface.read_until
+        # Build every register up front - they are cheap and finite - so the
+        # command hot path is a plain dict lookup with no construction branch.
         self.registers = {}
+        # Pre-rendered payloads for commands without parameters; their bytes
+        # can never change, so sending them skips the register entirely.
+        self._static_payloads = {}
+        # Specialized senders with the exact payload prebound, so dispatching
+        # a parameterless command is one dict probe and one call.
+        self._dispatch = {}
+        get_descriptor = getattr(command_loader, 'get_descriptor', None)
+        for command in getattr(command_loader, 'commands', []):
+            if get_descriptor is not None:
+                register = VirtualRegister.from_descriptor(get_descriptor(command['name']))
+            else:
+                register = VirtualRegister(command)
+            self.registers[command['name']] = register
+            if not register.parameters:
+                payload = bytes(register.get_bytes())
+                self._static_payloads[command['name']] = payload
+                self._dispatch[command['name']] = self._make_static_sender(payload)
+
+    def _make_static_sender(self, payload: bytes):
+        """
+        Build a closure that writes the given payload and reads the response.
+        """
+        write = self._write
+        read_until = self._read_until
+        interface = self.communication_interface
+
+        def send() -> bytes:
+            write(payload)
+            # Devices may answer with several frames (e.g. ACK followed by
+            # COMPLETION); drain them all so none stay buffered to misalign
+            # the next command's read.
+            response = read_until(b'\xff')
+            while interface.in_waiting:
+                response += read_until(b'\xff')
+            return response
+
+        return send
+
+    def execute_batch(self, command_names: list[str]) -> list[bytes]:
+        """
+        Execute a sequence of parameterless commands with a single write.
+
+        The pre-rendered payloads are concatenated and sent in one call, so
+        the per-write overhead is paid once for the whole sequence; the
+        terminator-delimited response frames are then read back until the
+        receive buffer is empty.
+
+        Args:
+            command_names (list[str]): The names of the commands to execute.
+
+        Returns:
+            list[bytes]: All response frames received for the batch, in
+            arrival order. Devices that acknowledge and complete separately
+            return more than one frame per command.
+        """
+        payloads = []
+        for command_name in command_names:
+            register = self.registers.get(command_name)
+            if register is None:
+                command = self.command_loader.get_command(command_name)
+                if command is None:
+                    logger.error("Command '%s' not found", command_name)
+                    continue
+                register = VirtualRegister(command)
+                self.registers[command_name] = register
+            payloads.append(bytes(register.get_bytes()))
+
+        if not payloads:
+            return []
+        self._write(b''.join(payloads))
+        # At least one frame arrives per command; drain whatever else is
+        # buffered so no response is left behind to misalign later reads.
+        read_until = self._read_until
+        frames = [read_until(b'\xff') for _ in payloads]
+        while self.communication_interface.in_waiting:
+            frames.append(read_until(b'\xff'))
+        return frames
+
+    def shutdown(self):
+        """
+        Close the communication interface.
+        """
+        logger.debug("Shutting down device")
+        self.communication_interface.close()
+
+    def __enter__(self):
+        self.initialize_device()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
 
     @abstractmethod
     def initialize_device(self):
@@ -48,21 +144,24 @@ class DeviceHandler(ABC):
         Args:
             command_name (str): The name of the command to execute.
         """
-        raise NotImplemented
+        pass
 
 
     def help(self):
         """
         Displays help information for all available commands and their parameters.
         """
-        logger.debug("Available Commands:")
+        # Accumulate the whole listing and emit it in one log call, instead of
+        # formatting, coloring and flushing a record per line.
+        lines = ["Available Commands:"]
         for cmd in self.command_loader.commands:
-            logger.debug(f"Command: {cmd['name']}")
-            logger.debug(f"  Description: {cmd['description']}")
+            lines.append(f"Command: {cmd['name']}")
+            lines.append(f"  Description: {cmd['description']}")
             if 'parameters' in cmd:
-                logger.debug("  Parameters:")
+                lines.append("  Parameters:")
                 for param, details in cmd['parameters'].items():
-                    logger.debug(f"    {param}: {details['description']}")
+                    lines.append(f"    {param}: {details['description']}")
+        logger.info("\n".join(lines))
 # -----------------------------------------------------------------------------
 # FUNCTIONS
 # -----------------------------------------------------------------------------
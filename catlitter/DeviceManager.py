@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-import coloredlogs
-import verboselogs
+import functools
+import os
 from catlitter.CommandLoader import CommandLoader
 from com.UARTCommunication import UARTCommunication
 from dev.CameraHandler import CameraHandler
 
+from catlitter._logging import get_logger
+
 # -----------------------------------------------------------------------------
 # COPYRIGHT
 # -----------------------------------------------------------------------------
@@ -19,9 +21,25 @@ __version__ = "1.0"
 # LOGGER
 # -----------------------------------------------------------------------------
 
-verboselogs.install()
-logger = verboselogs.VerboseLogger("module_logger")
-coloredlogs.install(level="debug", logger=logger)
+logger = get_logger(__name__)
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS
+# -----------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=None)
+def _load_commands(path: str) -> CommandLoader:
+    """
+    Parse the command configuration once per process for a given absolute path.
+
+    Args:
+        path (str): Absolute path to the command configuration YAML file.
+
+    Returns:
+        CommandLoader: The cached command loader for that file.
+    """
+    return CommandLoader(path)
 
 
 # -----------------------------------------------------------------------------
@@ -43,7 +61,7 @@ class DeviceManager:
             port (str): The COM port for UART communication.
             baudrate (int): The baud rate for UART communication.
         """
-        self.command_loader = CommandLoader(command_config)
+        self.command_loader = _load_commands(os.path.abspath(command_config))
         self.uart_communication = UARTCommunication(port=port, baudrate=baudrate)
 
     def get_camera_handler(self):
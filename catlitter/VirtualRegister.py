@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-import coloredlogs
-import verboselogs
+import logging
+
+from catlitter._logging import get_logger
 
 # -----------------------------------------------------------------------------
 # COPYRIGHT
@@ -16,9 +17,11 @@ __version__ = "1.0"
 # LOGGER
 # -----------------------------------------------------------------------------
 
-verboselogs.install()
-logger = verboselogs.VerboseLogger("module_logger")
-coloredlogs.install(level="debug", logger=logger)
+logger = get_logger(__name__)
+
+# Cached so hot paths skip the logging call machinery entirely when the
+# debug level is filtered out.
+_DEBUG = logger.isEnabledFor(logging.DEBUG)
 
 
 # -----------------------------------------------------------------------------
@@ -30,10 +33,15 @@ class VirtualRegister:
 
     Attributes:
         command (dict): The command dictionary.
-        bytes (list): List of command bytes.
+        bytes (list): List of command bytes as loaded from the config.
         parameters (dict): Dictionary of parameters and their possible values.
     """
 
+    # One register exists per command per handler; dropping the per-instance
+    # __dict__ keeps them small and cache-friendly when iterated.
+    __slots__ = ('command', 'bytes', 'parameters', '_param_index',
+                 '_template', '_param_byte_indices')
+
     def __init__(self, command: dict):
         """
         Initialize the VirtualRegister with the given command.
@@ -41,11 +49,42 @@ class VirtualRegister:
         Args:
             command (dict): The command dictionary.
         """
-        logger.debug("Initializing VirtualRegister with command: %s", command)
+        if _DEBUG:
+            logger.debug("Initializing VirtualRegister with command: %s", command)
         self.command = command
         self.bytes = command['bytes']
+        self._param_index: dict[str, int] = {}
         self.parameters = self._extract_parameters()
-        logger.debug("Extracted parameters: %s", self.parameters)
+        # Prebuilt wire image: literals in place, 0x00 in parameter slots.
+        # set_byte/set_parameter patch it in place so get_bytes is a plain copy.
+        self._template = bytearray(b if isinstance(b, int) else 0x00 for b in self.bytes)
+        self._param_byte_indices = frozenset(self._param_index.values())
+        if _DEBUG:
+            logger.debug("Extracted parameters: %s", self.parameters)
+
+    @classmethod
+    def from_descriptor(cls, descriptor) -> "VirtualRegister":
+        """
+        Build a register as a thin mutable view over a compiled descriptor.
+
+        Skips the per-construction schema walk: the descriptor already holds
+        the parameter index and value sets, so only the mutable template copy
+        is made here.
+
+        Args:
+            descriptor (CommandDescriptor): The compiled command descriptor.
+
+        Returns:
+            VirtualRegister: The register backed by the descriptor.
+        """
+        self = cls.__new__(cls)
+        self.command = descriptor.raw
+        self.bytes = descriptor.raw['bytes']
+        self._param_index = descriptor.param_index
+        self.parameters = descriptor.param_sets
+        self._template = bytearray(descriptor.template_bytes)
+        self._param_byte_indices = frozenset(descriptor.param_index.values())
+        return self
 
     def _extract_parameters(self) -> dict:
         """
@@ -54,12 +93,14 @@ class VirtualRegister:
         Returns:
             dict: Dictionary of parameters and their possible values.
         """
-        logger.debug("Extracting parameters from command bytes")
         parameters = {}
-        for byte in self.bytes:
+        for i, byte in enumerate(self.bytes):
             if isinstance(byte, dict):
-                parameters[byte['param_name']] = byte['values']
-        logger.debug("Parameters extracted: %s", parameters)
+                # frozenset gives O(1) membership tests in set_parameter.
+                parameters[byte['param_name']] = frozenset(byte['values'])
+                self._param_index[byte['param_name']] = i
+        if _DEBUG:
+            logger.debug("Parameters extracted: %s", parameters)
         return parameters
 
     def set_byte(self, index: int, value: int):
@@ -74,28 +115,37 @@ class VirtualRegister:
             ValueError: If trying to set a value directly for a parameter byte.
             IndexError: If the byte index is out of range.
         """
-        logger.debug("Setting byte at index %d to value %02X", index, value)
-        if index < len(self.bytes):
-            if isinstance(self.bytes[index], dict):
-                logger.debug("Cannot set value directly for a parameter byte at index %d", index)
-                raise ValueError("Cannot set value directly for a parameter byte")
-            self.bytes[index] = value
+        if _DEBUG:
+            logger.debug("Setting byte at index %d to value %02X", index, value)
+        if index in self._param_byte_indices:
+            raise ValueError("Cannot set value directly for a parameter byte")
+        try:
+            self._template[index] = value
+        except IndexError:
+            raise IndexError("Byte index out of range") from None
+        if _DEBUG:
             logger.debug("Byte set successfully at index %d", index)
-        else:
-            logger.debug("Byte index %d out of range", index)
-            raise IndexError("Byte index out of range")
 
-    def get_bytes(self) -> list[int]:
+    def get_bytes(self) -> bytearray:
         """
         Retrieve the current command bytes.
 
+        Returns the live wire buffer without copying; callers should treat it
+        as read-only and use set_byte/set_parameter to modify the command.
+
+        Returns:
+            bytearray: The current command bytes, ready to write to the wire.
+        """
+        return self._template
+
+    def get_bytes_view(self) -> memoryview:
+        """
+        Retrieve a zero-copy view of the current command bytes.
+
         Returns:
-            list[int]: List of current command bytes.
+            memoryview: A view over the live wire buffer.
         """
-        logger.debug("Retrieving command bytes")
-        byte_array = [byte if not isinstance(byte, dict) else 0x00 for byte in self.bytes]
-        logger.debug("Current command bytes: %s", byte_array)
-        return byte_array
+        return memoryview(self._template)
 
     def get_possible_parameters(self) -> dict:
         """
@@ -105,7 +155,6 @@ class VirtualRegister:
         Returns:
             dict: Dictionary of parameters and their possible values.
         """
-        logger.debug("Getting possible parameters: %s", self.parameters)
         return self.parameters
 
     def set_parameter(self, param: str, value: int):
@@ -120,19 +169,17 @@ class VirtualRegister:
         Raises:
             ValueError: If the parameter is not valid for this command or the value is not valid for the parameter.
         """
-        logger.debug("Setting parameter %s to value %02X", param, value)
+        if _DEBUG:
+            logger.debug("Setting parameter %s to value %02X", param, value)
         if param in self.parameters:
             if value in self.parameters[param]:
-                for i, byte in enumerate(self.bytes):
-                    if isinstance(byte, dict) and byte['param_name'] == param:
-                        self.bytes[i] = value
-                        logger.debug("Parameter %s set to value %02X at index %d", param, value, i)
-                        break
+                index = self._param_index[param]
+                self._template[index] = value
+                if _DEBUG:
+                    logger.debug("Parameter %s set to value %02X at index %d", param, value, index)
             else:
-                logger.debug("Value %02X not valid for parameter %s", value, param)
                 raise ValueError(f"Value {value} not valid for parameter {param}")
         else:
-            logger.debug("Parameter %s not valid for this command", param)
             raise ValueError(f"Parameter {param} not valid for this command")
 
 
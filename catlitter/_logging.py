@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+import logging
+import os
+import coloredlogs
+import verboselogs
+
+# -----------------------------------------------------------------------------
+# COPYRIGHT
+# -----------------------------------------------------------------------------
+
+__author__ = "Noel Ernsting Luz"
+__copyright__ = "Copyright (C) 2022 Noel Ernsting Luz"
+__license__ = "Public Domain"
+__version__ = "1.0"
+
+# -----------------------------------------------------------------------------
+# MODULE STATE
+# -----------------------------------------------------------------------------
+
+_INSTALLED = False
+_LOGGERS: dict[str, logging.Logger] = {}
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS
+# -----------------------------------------------------------------------------
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Return a logger for the given module name, installing verboselogs and
+    coloredlogs exactly once for the whole process.
+
+    Every module previously ran verboselogs.install() and
+    coloredlogs.install() at import time against a shared "module_logger",
+    re-wiring handlers on each import. This helper performs that setup a
+    single time and hands out per-module loggers instead.
+
+    Args:
+        name (str): The logger name, usually the caller's __name__.
+
+    Returns:
+        logging.Logger: The logger for the given name.
+    """
+    global _INSTALLED
+    logger = _LOGGERS.get(name)
+    if logger is not None:
+        return logger
+    if not _INSTALLED:
+        verboselogs.install()
+        # Default to INFO so hot-path debug calls short-circuit; set
+        # VISCA_LOG_LEVEL=DEBUG to turn on full diagnostics.
+        coloredlogs.install(level=os.environ.get("VISCA_LOG_LEVEL", "INFO"))
+        _INSTALLED = True
+    logger = logging.getLogger(name)
+    _LOGGERS[name] = logger
+    return logger
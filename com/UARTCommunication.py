@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-import coloredlogs
-import verboselogs
+import logging
+import os
+import queue
+import threading
 import serial
 from catlitter.CommunicationInterface import CommunicationInterface
 
+from catlitter._logging import get_logger
+
 # -----------------------------------------------------------------------------
 # COPYRIGHT
 # -----------------------------------------------------------------------------
@@ -18,9 +22,11 @@ __version__ = "1.0"
 # LOGGER
 # -----------------------------------------------------------------------------
 
-verboselogs.install()
-logger = verboselogs.VerboseLogger(__name__)
-coloredlogs.install(level="debug", logger=logger)
+logger = get_logger(__name__)
+
+# Cached so hot paths skip the logging call machinery entirely when the
+# debug level is filtered out.
+_DEBUG = logger.isEnabledFor(logging.DEBUG)
 
 
 # -----------------------------------------------------------------------------
@@ -37,7 +43,9 @@ class UARTCommunication(CommunicationInterface):
         ser (serial.Serial): The serial communication object.
     """
 
-    def __init__(self, port: str, baudrate: int = 9600, timeout: float = 1.0):
+    __slots__ = ('port', 'baudrate', 'timeout', 'ser', '_rx', '_reader', '_running')
+
+    def __init__(self, port: str, baudrate: int = 9600, timeout: float = 0.05):
         """
         Initialize the UARTCommunication with the given parameters.
 
@@ -50,23 +58,101 @@ class UARTCommunication(CommunicationInterface):
         self.baudrate = baudrate
         self.timeout = timeout
         self.ser = None
+        self._rx = None
+        self._reader = None
+        self._running = False
 
     def open(self):
         """
-        Open the UART communication interface.
+        Open the UART communication interface. Does nothing if already open.
         """
-        logger.debug("Opening UART port: %s", self.port)
+        if self.ser and self.ser.is_open:
+            return
+        if _DEBUG:
+            logger.debug("Opening UART port: %s", self.port)
         self.ser = serial.Serial(self.port, self.baudrate, timeout=self.timeout)
-        logger.debug("UART port opened: %s", self.port)
+        self._set_low_latency()
+        if _DEBUG:
+            logger.debug("UART port opened: %s", self.port)
+
+    def _set_low_latency(self):
+        """
+        Drop the USB-serial latency timer to 1 ms where the kernel exposes it.
+
+        FTDI adapters default to 16 ms, capping small-message round-trips at
+        roughly 62 per second. Silently a no-op on non-FTDI or non-Linux.
+        """
+        latency_path = os.path.join('/sys/bus/usb-serial/devices',
+                                    os.path.basename(self.port), 'latency_timer')
+        try:
+            with open(latency_path, 'wb') as latency:
+                latency.write(b'1')
+        except OSError:
+            pass
+
+    def start_reader(self):
+        """
+        Start a daemon thread that continuously reads terminator-delimited
+        frames into an internal queue.
+
+        Decouples the write cadence from the per-read overhead: callers write
+        at full rate and pop completed responses with get_response().
+        """
+        if self._reader is not None and self._reader.is_alive():
+            return
+        self._rx = queue.SimpleQueue()
+        self._running = True
+        self._reader = threading.Thread(target=self._read_loop, daemon=True)
+        self._reader.start()
+
+    def _read_loop(self):
+        while self._running:
+            try:
+                frame = self.ser.read_until(b'\xff')
+            except serial.SerialException:
+                # The port was closed or unplugged under us; exit cleanly
+                # instead of dying with a traceback from the daemon thread.
+                break
+            if frame:
+                self._rx.put(frame)
+
+    def get_response(self, timeout: float | None = None) -> bytes:
+        """
+        Pop the next frame collected by the reader thread.
+
+        Args:
+            timeout (float): Seconds to wait for a frame, or None to block.
+
+        Returns:
+            bytes: The next terminator-delimited frame.
+        """
+        return self._rx.get(timeout=timeout)
+
+    def stop_reader(self):
+        """
+        Stop the reader thread and wait for it to exit.
+
+        The join is bounded by the read timeout, so the wait is short; it
+        guarantees no read is still in flight when the port gets closed.
+        """
+        self._running = False
+        reader = self._reader
+        if (reader is not None and reader.is_alive()
+                and reader is not threading.current_thread()):
+            reader.join(timeout=max(1.0, self.timeout * 2))
+        self._reader = None
 
     def close(self):
         """
         Close the UART communication interface.
         """
-        logger.debug("Closing UART port: %s", self.port)
+        if _DEBUG:
+            logger.debug("Closing UART port: %s", self.port)
+        self.stop_reader()
         if self.ser and self.ser.is_open:
             self.ser.close()
-            logger.debug("UART port closed: %s", self.port)
+            if _DEBUG:
+                logger.debug("UART port closed: %s", self.port)
 
     def read(self, size: int) -> bytes:
         """
@@ -78,11 +164,68 @@ class UARTCommunication(CommunicationInterface):
         Returns:
             bytes: The data read from the UART communication interface.
         """
-        logger.debug("Reading %d bytes from UART port: %s", size, self.port)
+        if _DEBUG:
+            logger.debug("Reading %d bytes from UART port: %s", size, self.port)
         data = self.ser.read(size)
-        logger.debug("Read data: %s", data)
+        if _DEBUG:
+            logger.debug("Read data: %s", data)
+        return data
+
+    def read_until(self, expected: bytes = b'\xff') -> bytes:
+        """
+        Read data until the expected terminator is found or the timeout expires.
+
+        Args:
+            expected (bytes): The terminator sequence to read up to.
+
+        Returns:
+            bytes: The data read, including the terminator if it was found.
+        """
+        data = self.ser.read_until(expected)
+        if _DEBUG:
+            logger.debug("Read data: %s", data)
         return data
 
+    def read_into(self, buf: bytearray) -> int:
+        """
+        Read available data directly into a caller-provided buffer.
+
+        Args:
+            buf (bytearray): The buffer to fill.
+
+        Returns:
+            int: The number of bytes read.
+        """
+        n = self.ser.readinto(buf)
+        if _DEBUG:
+            logger.debug("Read %d bytes into buffer", n)
+        return n
+
+    def write_then_read(self, data: bytes, terminator: bytes = b'\xff') -> bytes:
+        """
+        Write a command and read its terminator-delimited response
+        back-to-back, without any Python-level bookkeeping in between.
+
+        Args:
+            data (bytes): The data to write.
+            terminator (bytes): The response terminator sequence.
+
+        Returns:
+            bytes: The response read, including the terminator if found.
+        """
+        self.ser.write(data)
+        response = self.ser.read_until(terminator)
+        if _DEBUG:
+            logger.debug("Wrote %s, read %s", data, response)
+        return response
+
+    @property
+    def in_waiting(self) -> int:
+        """
+        Number of bytes currently buffered in the receive queue.
+        """
+        return self.ser.in_waiting if self.ser else 0
+
     def write(self, data: bytes):
         """
         Write data to the UART communication interface.
@@ -90,9 +233,11 @@ class UARTCommunication(CommunicationInterface):
         Args:
             data (bytes): The data to write.
         """
-        logger.debug("Writing data to UART port: %s", self.port)
+        if _DEBUG:
+            logger.debug("Writing data to UART port: %s", self.port)
         self.ser.write(data)
-        logger.debug("Data written to UART port: %s", data)
+        if _DEBUG:
+            logger.debug("Data written to UART port: %s", data)
 # -----------------------------------------------------------------------------
 # FUNCTIONS
 # -----------------------------------------------------------------------------
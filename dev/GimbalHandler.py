@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-import coloredlogs
-import verboselogs
+import logging
 
-from catlitter import VirtualRegister, DeviceHandler
+from catlitter.VirtualRegister import VirtualRegister
+from catlitter.DeviceHandler import DeviceHandler
+
+from catlitter._logging import get_logger
 
 # -----------------------------------------------------------------------------
 # COPYRIGHT
@@ -18,20 +20,41 @@ __version__ = "1.0"
 # LOGGER
 # -----------------------------------------------------------------------------
 
-verboselogs.install()
-logger = verboselogs.VerboseLogger("module_logger")
-coloredlogs.install(level="debug", logger=logger)
+logger = get_logger(__name__)
+
+# Cached so hot paths skip the logging call machinery entirely when the
+# debug level is filtered out.
+_DEBUG = logger.isEnabledFor(logging.DEBUG)
+
+
+# VISCA status byte -> human-readable meaning, used by _evaluate_response.
+_VISCA_STATUS = {
+    0x41: "[ACK] Acknowledgment received for a command.",
+    0x51: "[COMPLETION] Command completed successfully.",
+    0x60: "[Syntax error] in command. Command format is incorrect or parameter value is out of range.",
+    0x61: "Command not executable. Current conditions do not allow this command to be executed.",
+}
 
 
 # -----------------------------------------------------------------------------
 # CLASSES
 # -----------------------------------------------------------------------------
 class GimbalHandler(DeviceHandler):
+    def __init__(self, command_loader, communication_interface):
+        super().__init__(command_loader, communication_interface)
+        # Last parameter values sent per command, so repeated commands in
+        # tight control loops skip re-validating unchanged kwargs.
+        self._last_params: dict[str, dict] = {}
+        # Reusable receive buffer for draining buffered response bytes.
+        self._rx_buf = bytearray(64)
+
     def initialize_device(self):
         """
         Initialize the camera device with necessary startup commands.
+        Opens the communication interface once; it stays open until shutdown().
         """
         logger.debug("Initializing gimbal device")
+        self.communication_interface.open()
         self.execute_command('CAM_PowerOn')
 
     def help(self):
@@ -44,39 +67,61 @@ class GimbalHandler(DeviceHandler):
     def read_response(self) -> dict:
         """
         Read and interpret the VISCA response from the camera.
-        Converts the response to a readable format and logs each part of the message.
         """
-        response = self.communication_interface.read(10)  # Adjust size based on expected response length
+        # VISCA messages are 0xFF-terminated; read up to the terminator instead
+        # of a fixed-size read that would otherwise block for the full timeout.
+        response = self.communication_interface.read_until(b'\xff')
+        return self._parse_response(self._drain(response))
+
+    def _drain(self, response: bytes) -> bytes:
+        """
+        Collect any further buffered response bytes into the reusable buffer.
+        """
+        buf = self._rx_buf
+        view = memoryview(buf)
+        while self.communication_interface.in_waiting:
+            n = self.communication_interface.read_into(buf)
+            if not n:
+                break
+            response += view[:n]
+        return response
+
+    def _parse_response(self, response: bytes) -> dict:
+        """
+        Interpret a raw VISCA response and log each contained message.
+        """
         if not response:
             logger.debug("No response received.")
             return {"status": "error", "message": "No response received"}
 
-        # Convert response to hexadecimal string
-        readable_response = ''.join(f"{byte:02x}" for byte in response)
-        logger.debug(f"Raw response received: {readable_response}")
-
-        # Assuming messages are separated by 'ff' and start with '90'
-        messages = readable_response.split('ff')
-        for msg in messages:
-            if msg.startswith('90'):
-                self._evaluate_response(msg)
+        if _DEBUG:
+            logger.debug("Raw response received: %s", response.hex())
+
+        # Messages are 0xFF-terminated and start with 0x90; parse the raw
+        # bytes directly instead of round-tripping through a hex string.
+        start = 0
+        while True:
+            end = response.find(b'\xff', start)
+            if end < 0:
+                break
+            msg = response[start:end]
+            if len(msg) >= 2 and msg[0] == 0x90:
+                self._evaluate_response(msg[1])
+            start = end + 1
 
         return {"status": "completed", "message": "All messages processed"}
 
-    def _evaluate_response(self, msg):
+    def _evaluate_response(self, status: int):
         """
-        Evaluate a single VISCA message.
+        Evaluate the status byte of a single VISCA message.
         """
-        if msg[2:4] == '41':  # Example: '41' Acknowledgment
-            logger.debug("[ACK] Acknowledgment received for a command.")
-        elif msg[2:4] == '51':  # Example: '51' Command Completion
-            logger.debug("[COMPLETION] Command completed successfully.")
-        elif msg[2:4] == '60':  # Example: '60' Syntax Error
-            logger.debug("[Syntax error] in command. Command format is incorrect or parameter value is out of range.")
-        elif msg[2:4] == '61':  # Example: '61' Command Not Executable
-            logger.debug("Command not executable. Current conditions do not allow this command to be executed.")
+        if not _DEBUG:
+            return
+        meaning = _VISCA_STATUS.get(status)
+        if meaning is not None:
+            logger.debug(meaning)
         else:
-            logger.debug(f"Unknown VISCA message: {msg}")
+            logger.debug("Unknown VISCA status byte: %02x", status)
 
     def execute_command(self, command_name: str, **kwargs):
         """
@@ -89,25 +134,37 @@ class GimbalHandler(DeviceHandler):
         """
         command = self.command_loader.get_command(command_name)
         if command:
-            if command_name not in self.registers:
-                self.registers[command_name] = VirtualRegister(command)
-
-            # Update command parameters with provided kwargs
+            register = self.registers.get(command_name)
+            if register is None:
+                register = VirtualRegister(command)
+                self.registers[command_name] = register
+
+            # Update command parameters with provided kwargs, skipping values
+            # identical to what was last sent for this command.
+            last = self._last_params.setdefault(command_name, {})
             for param, value in kwargs.items():
-                if param in self.registers[command_name].parameters:
-                    self.registers[command_name].set_parameter(param, value)
-                else:
-                    logger.debug(f"Parameter {param} not recognized for command {command_name}")
-
-            self.communication_interface.open()
-            self.communication_interface.write(bytes(self.registers[command_name].get_bytes()))
-            response = self.read_response()  # Use the specialized VISCA response reader
-            self.communication_interface.close()
-            logger.debug(f"Response for command '{command_name}': {response['message']}")
-            if response['status'] == 'error':
-                logger.debug(f"Error executing command '{command_name}': {response['message']}")
+                if param in register.parameters:
+                    if last.get(param) != value:
+                        register.set_parameter(param, value)
+                        last[param] = value
+                elif _DEBUG:
+                    logger.debug("Parameter %s not recognized for command %s", param, command_name)
+
+            # Prefer the interface's combined write+read fast path when it
+            # offers one; fall back to separate calls otherwise.
+            write_then_read = getattr(self.communication_interface, 'write_then_read', None)
+            if write_then_read is not None:
+                raw = write_then_read(register.get_bytes())
+                response = self._parse_response(self._drain(raw))
+            else:
+                self.communication_interface.write(register.get_bytes())
+                response = self.read_response()
+            if _DEBUG:
+                logger.debug("Response for command '%s': %s", command_name, response['message'])
+                if response['status'] == 'error':
+                    logger.debug("Error executing command '%s': %s", command_name, response['message'])
         else:
-            logger.debug(f"Command '{command_name}' not found")
+            logger.debug("Command '%s' not found", command_name)
 
 # -----------------------------------------------------------------------------
 # FUNCTIONS
@@ -1,6 +1,14 @@
 import serial
 import struct
 
+# Prebuilt format objects so the parsers below don't recompile the format
+# string on every unpack; unpack_from also avoids the slice copies.
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+# CMD_REALTIME_DATA_3 header: timestamp, sensor, encoder, control,
+# temperatures, error flags - unpacked in a single call.
+_REALTIME_DATA_3 = struct.Struct('<H3h3H3h7bH')
+
 class UARTCommunication:
     def __init__(self, port, baudrate):
         self.port = port
@@ -16,13 +24,16 @@ class UARTCommunication:
             self.ser.close()
 
     def send_command(self, command_id, payload=b''):
-        start_char = b'>'
         payload_size = len(payload)
-        header_checksum = (command_id + payload_size) % 256
-        header = struct.pack('BB', command_id, payload_size)
-        message = start_char + header + bytes([header_checksum]) + payload
-        payload_checksum = sum(payload) % 256
-        message += bytes([payload_checksum])
+        header_checksum = (command_id + payload_size) & 0xFF
+        # memoryview.cast('B') keeps the sum over raw bytes without an
+        # intermediate list, and works for any bytes-like payload.
+        payload_checksum = sum(memoryview(payload).cast('B')) & 0xFF if payload_size else 0
+        # Pack the whole frame in one go instead of concatenating five
+        # intermediate bytes objects.
+        message = struct.pack(f'<cBBB{payload_size}sB', b'>', command_id,
+                              payload_size, header_checksum, bytes(payload),
+                              payload_checksum)
         self.ser.write(message)
 
     def read_response(self, size=64):
@@ -35,16 +46,16 @@ def parse_board_info(data):
 
     board_info = {
         "board_ver": data[0] / 10,
-        "firmware_ver": struct.unpack('<H', data[1:3])[0] / 1000,
+        "firmware_ver": _U16.unpack_from(data, 1)[0] / 1000,
         "state_flags": data[3],
-        "board_features": struct.unpack('<H', data[4:6])[0],
+        "board_features": _U16.unpack_from(data, 4)[0],
         "connection_flag": data[6],
-        "frw_extra_id": struct.unpack('<I', data[7:11])[0],
-        "board_features_ext": struct.unpack('<H', data[11:13])[0],
-        "base_frw_ver": struct.unpack('<H', data[13:15])[0] / 10,
-        "flash_size": struct.unpack('<H', data[17:19])[0],
-        "eeprom_size": struct.unpack('<I', data[19:23])[0],
-        "gui_ver": struct.unpack('<H', data[23:25])[0] / 1000,
+        "frw_extra_id": _U32.unpack_from(data, 7)[0],
+        "board_features_ext": _U16.unpack_from(data, 11)[0],
+        "base_frw_ver": _U16.unpack_from(data, 13)[0] / 10,
+        "flash_size": _U16.unpack_from(data, 17)[0],
+        "eeprom_size": _U32.unpack_from(data, 19)[0],
+        "gui_ver": _U16.unpack_from(data, 23)[0] / 1000,
         "device_id": data[25:34].hex(),
     }
 
@@ -56,12 +67,13 @@ def parse_realtime_data_3(data):
         return {}
 
     # Example parsing (the actual structure may vary based on the protocol specification)
-    timestamp = struct.unpack('<H', data[0:2])[0]
-    sensor_data = struct.unpack('<3h', data[2:8])
-    encoder_data = struct.unpack('<3H', data[8:14])
-    control_data = struct.unpack('<3h', data[14:20])
-    temperature_data = struct.unpack('<7b', data[20:27])
-    error_flags = struct.unpack('<H', data[27:29])[0]
+    fields = _REALTIME_DATA_3.unpack_from(data, 0)
+    timestamp = fields[0]
+    sensor_data = fields[1:4]
+    encoder_data = fields[4:7]
+    control_data = fields[7:10]
+    temperature_data = fields[10:17]
+    error_flags = fields[17]
 
     realtime_data = {
         "timestamp": timestamp,